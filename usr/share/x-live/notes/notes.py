@@ -6,17 +6,439 @@ import subprocess
 import re
 import yaml
 import locale
+import html
+import random
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QTextEdit, QLineEdit, QListWidget, QFontDialog,
                              QVBoxLayout, QHBoxLayout, QWidget, QSystemTrayIcon, QSplitter, QLabel,
-                             QMenu, QAction, QInputDialog, QMessageBox, QPushButton, QGridLayout)
-from PyQt5.QtGui import QIcon, QFont
-from PyQt5.QtCore import QFile, QTextStream, QDir, Qt, QEvent, QTranslator
+                             QMenu, QAction, QInputDialog, QMessageBox, QPushButton, QGridLayout, QTextBrowser)
+from PyQt5.QtGui import (QIcon, QFont, QColor, QSyntaxHighlighter, QTextCharFormat, QTextCursor,
+                         QTextDocument, QTextDocumentFragment, QDesktopServices)
+from PyQt5.QtCore import (QFile, QTextStream, QDir, Qt, QEvent, QTranslator, QObject, QThread, QTimer,
+                          QUrl, pyqtSignal, pyqtSlot)
 
 # Pfad zum Arbeitsverzeichnis festlegen
 arbeitsverzeichnis = os.path.expanduser('/usr/share/x-live/notes/')
 os.chdir(arbeitsverzeichnis)
 
 
+# Markdown-Muster für Hervorhebung und Vorschau
+MD_FENCE = re.compile(r'^\s*(```|~~~)')
+MD_HEADING = re.compile(r'^(#{1,6})\s+(.*?)\s*#*\s*$')
+MD_RULE = re.compile(r'^\s*([-*_])(\s*\1){2,}\s*$')
+MD_QUOTE = re.compile(r'^\s*>\s?(.*)$')
+MD_LIST = re.compile(r'^\s*([-*+]|\d+[.)])\s+(.*)$')
+MD_BOLD = re.compile(r'(\*\*|__)(?=\S)(.+?)(?<=\S)\1')
+MD_ITALIC = re.compile(r'(?<![*_\w])([*_])(?=\S)(.+?)(?<=\S)\1(?![*_\w])')
+MD_CODE = re.compile(r'`([^`]+)`')
+MD_LINK = re.compile(r'\[([^\]]+)\]\(([^)\s]+)\)')
+
+# Shift+Enter fügt im QTextEdit einen weichen Zeilenumbruch innerhalb des Blocks ein
+SOFT_BREAK = "\u2028"
+
+
+def split_markdown_sections(text):
+    """Teilt den Text an Überschriften (außerhalb von Codeblöcken) in Abschnitte."""
+    sections = []
+    current = []
+    in_fence = False
+    for line in text.split("\n"):
+        if MD_FENCE.match(line):
+            in_fence = not in_fence
+        elif not in_fence and MD_HEADING.match(line) and current:
+            sections.append("\n".join(current))
+            current = []
+        current.append(line)
+    sections.append("\n".join(current))
+    return sections
+
+
+def render_markdown_inline(text):
+    """Wandelt Inline-Markdown (Code, Links, Fett, Kursiv) in HTML um."""
+    kept = []
+
+    def keep(fragment):
+        # Fertiges HTML durch Platzhalter schützen, damit Fett/Kursiv es nicht verändern
+        kept.append(fragment)
+        return f"\x00{len(kept) - 1}\x00"
+
+    def emphasis(fragment):
+        fragment = MD_BOLD.sub(r'<b>\2</b>', html.escape(fragment))
+        return MD_ITALIC.sub(r'<i>\2</i>', fragment)
+
+    def restore(fragment):
+        return re.sub(r'\x00(\d+)\x00', lambda match: restore(kept[int(match.group(1))]), fragment)
+
+    text = MD_CODE.sub(lambda match: keep(f"<code>{html.escape(match.group(1))}</code>"), text)
+    text = MD_LINK.sub(lambda match: keep(f'<a href="{html.escape(match.group(2))}">{emphasis(match.group(1))}</a>'),
+                       text)
+    return restore(emphasis(text))
+
+
+def render_markdown_section(text):
+    """Wandelt einen Markdown-Abschnitt in HTML um."""
+    parts = []
+    paragraph = []
+    list_tag = None
+    code_lines = None
+
+    def close_paragraph():
+        if paragraph:
+            parts.append("<p>" + "<br>".join(render_markdown_inline(line) for line in paragraph) + "</p>")
+            paragraph.clear()
+
+    def close_list():
+        nonlocal list_tag
+        if list_tag:
+            parts.append(f"</{list_tag}>")
+            list_tag = None
+
+    for line in text.split("\n"):
+        if code_lines is not None:
+            if MD_FENCE.match(line):
+                parts.append("<pre>" + html.escape("\n".join(code_lines)) + "</pre>")
+                code_lines = None
+            else:
+                code_lines.append(line)
+            continue
+        if MD_FENCE.match(line):
+            close_paragraph()
+            close_list()
+            code_lines = []
+            continue
+        if not line.strip():
+            close_paragraph()
+            close_list()
+            continue
+        heading = MD_HEADING.match(line)
+        list_item = MD_LIST.match(line)
+        quote = MD_QUOTE.match(line)
+        if heading:
+            close_paragraph()
+            close_list()
+            level = len(heading.group(1))
+            parts.append(f"<h{level}>{render_markdown_inline(heading.group(2))}</h{level}>")
+        elif MD_RULE.match(line):
+            close_paragraph()
+            close_list()
+            parts.append("<hr>")
+        elif list_item:
+            close_paragraph()
+            tag = "ol" if list_item.group(1)[0].isdigit() else "ul"
+            if list_tag != tag:
+                close_list()
+                parts.append(f"<{tag}>")
+                list_tag = tag
+            parts.append(f"<li>{render_markdown_inline(list_item.group(2))}</li>")
+        elif quote:
+            close_paragraph()
+            close_list()
+            parts.append(f"<blockquote>{render_markdown_inline(quote.group(1))}</blockquote>")
+        else:
+            close_list()
+            paragraph.append(line)
+
+    close_paragraph()
+    close_list()
+    if code_lines is not None:
+        parts.append("<pre>" + html.escape("\n".join(code_lines)) + "</pre>")
+    return "".join(parts)
+
+
+def insert_html_section(cursor, section_html):
+    """Fügt gerendertes HTML an cursor ein und liefert die Anzahl der Blöcke.
+
+    Der erste eingefügte Block übernimmt sonst das Format des Blocks am Cursor,
+    daher werden Block- und Listenformat vorher vom Fragment übernommen.
+    """
+    fragment = QTextDocument()
+    fragment.setHtml(section_html)
+    first = fragment.begin()
+    text_list = cursor.block().textList()
+    if text_list:
+        text_list.remove(cursor.block())
+    cursor.setBlockFormat(first.blockFormat())
+    cursor.setBlockCharFormat(first.charFormat())
+    if first.textList():
+        cursor.createList(first.textList().format())
+    cursor.insertFragment(QTextDocumentFragment(fragment))
+    return fragment.blockCount()
+
+
+class MarkdownHighlighter(QSyntaxHighlighter):
+    """Markdown-Hervorhebung für das Textfeld.
+
+    QSyntaxHighlighter bearbeitet nur die geänderten Blöcke; der Blockzustand
+    (innerhalb eines Codeblocks oder nicht) sorgt dafür, dass Folgeblöcke nur
+    neu hervorgehoben werden, wenn sich dieser Zustand ändert.
+    """
+
+    STATE_NORMAL = 0
+    STATE_FENCE = 1
+
+    def __init__(self, document):
+        super().__init__(document)
+        self.heading_format = QTextCharFormat()
+        self.heading_format.setFontWeight(QFont.Bold)
+        self.bold_format = QTextCharFormat()
+        self.bold_format.setFontWeight(QFont.Bold)
+        self.italic_format = QTextCharFormat()
+        self.italic_format.setFontItalic(True)
+        self.code_format = QTextCharFormat()
+        self.code_format.setFontFamily("monospace")
+        self.code_format.setForeground(QColor("#808080"))
+        self.link_format = QTextCharFormat()
+        self.link_format.setForeground(QColor("#3584e4"))
+        self.link_format.setFontUnderline(True)
+        self.marker_format = QTextCharFormat()
+        self.marker_format.setForeground(QColor("#808080"))
+
+    def highlightBlock(self, text):
+        # Codeblöcke (```) über den Blockzustand verfolgen
+        in_fence = self.previousBlockState() == self.STATE_FENCE
+        if MD_FENCE.match(text):
+            self.setFormat(0, len(text), self.code_format)
+            self.setCurrentBlockState(self.STATE_NORMAL if in_fence else self.STATE_FENCE)
+            return
+        if in_fence:
+            self.setFormat(0, len(text), self.code_format)
+            self.setCurrentBlockState(self.STATE_FENCE)
+            return
+        self.setCurrentBlockState(self.STATE_NORMAL)
+
+        if MD_HEADING.match(text):
+            self.setFormat(0, len(text), self.heading_format)
+            return
+        if MD_RULE.match(text):
+            self.setFormat(0, len(text), self.marker_format)
+            return
+        marker = MD_LIST.match(text) or MD_QUOTE.match(text)
+        if marker:
+            self.setFormat(0, marker.start(marker.lastindex), self.marker_format)
+
+        # setFormat überschreibt, daher kursive Treffer innerhalb von Fett auslassen
+        bold_spans = [match.span() for match in MD_BOLD.finditer(text)]
+        for start, end in bold_spans:
+            self.setFormat(start, end - start, self.bold_format)
+        for match in MD_ITALIC.finditer(text):
+            if not any(start < match.end() and match.start() < end for start, end in bold_spans):
+                self.setFormat(match.start(), match.end() - match.start(), self.italic_format)
+
+        for pattern, char_format in ((MD_LINK, self.link_format), (MD_CODE, self.code_format)):
+            for match in pattern.finditer(text):
+                self.setFormat(match.start(), match.end() - match.start(), char_format)
+
+
+class MarkdownPreviewWorker(QObject):
+    """Rendert Markdown-Abschnitte im Hintergrund-Thread."""
+
+    render_requested = pyqtSignal(int, list)
+    rendered = pyqtSignal(int, dict)
+
+    def __init__(self):
+        super().__init__()
+        self.render_requested.connect(self.render)
+
+    @pyqtSlot(int, list)
+    def render(self, generation, sections):
+        self.rendered.emit(generation, {section: render_markdown_section(section) for section in sections})
+
+
+class BlockCountNode:
+    """Knoten von BlockCounts mit den Summen seines Teilbaums."""
+
+    __slots__ = ("priority", "left", "right", "size", "chars", "words", "breaks",
+                 "total_chars", "total_words", "total_breaks")
+
+    def __init__(self, chars, words, breaks):
+        self.priority = random.random()
+        self.left = None
+        self.right = None
+        self.size = 1
+        self.chars = self.total_chars = chars
+        self.words = self.total_words = words
+        self.breaks = self.total_breaks = breaks
+
+    def update(self):
+        self.size = 1
+        self.total_chars = self.chars
+        self.total_words = self.words
+        self.total_breaks = self.breaks
+        for child in (self.left, self.right):
+            if child:
+                self.size += child.size
+                self.total_chars += child.total_chars
+                self.total_words += child.total_words
+                self.total_breaks += child.total_breaks
+
+
+class BlockCounts:
+    """(Zeichen, Wörter, weiche Zeilenumbrüche) je Block als impliziter Treap.
+
+    Blöcke lassen sich an beliebiger Stelle ersetzen und Summen über
+    Blockbereiche abfragen, beides in O(log n) pro Block.
+    """
+
+    def __init__(self):
+        self.root = None
+
+    def __len__(self):
+        return self.root.size if self.root else 0
+
+    def chars(self):
+        return self.root.total_chars if self.root else 0
+
+    def words(self):
+        return self.root.total_words if self.root else 0
+
+    def breaks(self):
+        return self.root.total_breaks if self.root else 0
+
+    def split(self, node, count):
+        # Teilt node in die ersten count Blöcke und den Rest
+        if node is None:
+            return None, None
+        left_size = node.left.size if node.left else 0
+        if count <= left_size:
+            left, node.left = self.split(node.left, count)
+            node.update()
+            return left, node
+        node.right, right = self.split(node.right, count - left_size - 1)
+        node.update()
+        return node, right
+
+    def merge(self, left, right):
+        if left is None or right is None:
+            return left or right
+        if left.priority > right.priority:
+            left.right = self.merge(left.right, right)
+            left.update()
+            return left
+        right.left = self.merge(left, right.left)
+        right.update()
+        return right
+
+    def replace(self, first, count, counts):
+        """Ersetzt count Blöcke ab first durch counts."""
+        left, rest = self.split(self.root, first)
+        _, right = self.split(rest, count)
+        self.root = self.merge(self.merge(left, self.build(counts)), right)
+
+    def build(self, counts):
+        # Baut den Treap in linearer Zeit über den rechten Rand auf
+        spine = []
+        for chars, words, breaks in counts:
+            node = BlockCountNode(chars, words, breaks)
+            last = None
+            while spine and spine[-1].priority < node.priority:
+                last = spine.pop()
+                last.update()
+            node.left = last
+            if spine:
+                spine[-1].right = node
+            spine.append(node)
+        for node in reversed(spine):
+            node.update()
+        return spine[0] if spine else None
+
+    def totals_before(self, count):
+        """Summe der Wörter und weichen Zeilenumbrüche in den ersten count Blöcken."""
+        words = breaks = 0
+        node = self.root
+        while node:
+            left_size = node.left.size if node.left else 0
+            if count <= left_size:
+                node = node.left
+                continue
+            words += node.words
+            breaks += node.breaks
+            if node.left:
+                words += node.left.total_words
+                breaks += node.left.total_breaks
+            count -= left_size + 1
+            node = node.right
+        return words, breaks
+
+
+class DocumentStatistics(QObject):
+    """Zählt Zeichen, Wörter und Zeilen eines QTextDocument blockweise.
+
+    Die Zählung wird aus den Änderungen von contentsChange nachgeführt, so dass
+    pro Tastendruck nur die betroffenen Blöcke neu gezählt werden.
+    """
+
+    changed = pyqtSignal()
+
+    def __init__(self, document):
+        super().__init__(document)
+        self.document = document
+        self.block_counts = BlockCounts()
+        self.on_contents_change(0, 0, document.characterCount())
+        document.contentsChange.connect(self.on_contents_change)
+
+    @staticmethod
+    def count_block(text):
+        return len(text), len(text.split()), text.count(SOFT_BREAK)
+
+    def on_contents_change(self, position, removed, added):
+        # Blöcke vor der Änderung sind unverändert; die Differenz der Blockanzahl
+        # ergibt, wie viele alte Blöcke durch die neuen ersetzt wurden
+        document = self.document
+        end = min(position + added, document.characterCount() - 1)
+        first = document.findBlock(position).blockNumber()
+        last = document.findBlock(end).blockNumber()
+        old_last = last - (document.blockCount() - len(self.block_counts))
+
+        new_counts = []
+        block = document.findBlockByNumber(first)
+        for _ in range(first, last + 1):
+            new_counts.append(self.count_block(block.text()))
+            block = block.next()
+
+        self.block_counts.replace(first, old_last + 1 - first, new_counts)
+        self.changed.emit()
+
+    def lines(self):
+        # Weiche Zeilenumbrüche werden beim Speichern zu Zeilenumbrüchen
+        return len(self.block_counts) + self.block_counts.breaks()
+
+    def words(self):
+        return self.block_counts.words()
+
+    def characters(self):
+        # Zeilenumbrüche zwischen den Blöcken zählen als Zeichen mit
+        return self.block_counts.chars() + len(self.block_counts) - 1
+
+    def position(self, cursor):
+        """Liefert (Zeile, Spalte) von cursor, wie sie in der gespeicherten Datei stehen."""
+        text = cursor.block().text()[:cursor.positionInBlock()]
+        line = cursor.blockNumber() + self.block_counts.totals_before(cursor.blockNumber())[1]
+        line += text.count(SOFT_BREAK)
+        return line + 1, len(text) - text.rfind(SOFT_BREAK)
+
+    def selection(self, cursor):
+        """Liefert (Zeichen, Wörter, Zeilen) der Auswahl von cursor."""
+        if not cursor.hasSelection():
+            return 0, 0, 0
+        document = self.document
+        start_block = document.findBlock(cursor.selectionStart())
+        end_block = document.findBlock(cursor.selectionEnd())
+        start = cursor.selectionStart() - start_block.position()
+        end = cursor.selectionEnd() - end_block.position()
+        first = start_block.blockNumber()
+        last = end_block.blockNumber()
+        if first == last:
+            parts = [start_block.text()[start:end]]
+            words = breaks = 0
+        else:
+            parts = [start_block.text()[start:], end_block.text()[:end]]
+            words_last, breaks_last = self.block_counts.totals_before(last)
+            words_first, breaks_first = self.block_counts.totals_before(first + 1)
+            words, breaks = words_last - words_first, breaks_last - breaks_first
+        words += sum(len(part.split()) for part in parts)
+        breaks += sum(part.count(SOFT_BREAK) for part in parts)
+        return cursor.selectionEnd() - cursor.selectionStart(), words, last - first + 1 + breaks
+
+
 class NotizVerwaltung(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -30,6 +452,11 @@ class NotizVerwaltung(QMainWindow):
         self.notes_dir = os.path.expanduser("~/x-live/notes/")
         self.settings_file = os.path.expanduser("~/.x-live/settings/notes.yml")
         self.settings_dir = os.path.expanduser("~/.x-live/settings/")
+        self.preview_sections = []  # Aktuell in der Vorschau angezeigte Abschnitte
+        self.preview_block_counts = []  # Anzahl der Vorschau-Blöcke je Abschnitt
+        self.preview_cache = {}     # Abschnittstext -> gerendertes HTML
+        self.pending_preview_sections = []
+        self.preview_generation = 0
 
         # Notizen-Verzeichnis prüfen oder erstellen
         if not os.path.exists(self.notes_dir):
@@ -57,6 +484,12 @@ class NotizVerwaltung(QMainWindow):
         # Tray-Icon erstellen
         self.init_tray_icon()
 
+        # Markdown-Hervorhebung und Vorschau
+        self.init_preview()
+
+        # Statusleiste mit Dokumentstatistik
+        self.init_status_bar()
+
 
         # Signale verbinden
         self.listWidget.itemClicked.connect(self.on_note_selected)
@@ -99,6 +532,11 @@ class NotizVerwaltung(QMainWindow):
         self.font_action.triggered.connect(self.change_font)
         self.button_menu.addAction(self.font_action)
 
+        self.preview_action = QAction("Vorschau", self)
+        self.preview_action.setCheckable(True)
+        self.preview_action.toggled.connect(self.toggle_preview)
+        self.button_menu.addAction(self.preview_action)
+
         self.button_menu.addSeparator()
 
         exit_action = QAction("Beenden", self)
@@ -141,12 +579,18 @@ class NotizVerwaltung(QMainWindow):
         left_layout.addWidget(self.listWidget)
         self.textEdit = QTextEdit()
         self.textEdit.setAcceptRichText(False) 
+        self.preview = QTextBrowser()
+        # Links selbst öffnen, sonst ersetzt QTextBrowser bei relativen Links das Dokument
+        self.preview.setOpenLinks(False)
+        self.preview.anchorClicked.connect(self.open_preview_link)
+        self.preview.hide()
         self.splitter = QSplitter()
         left_widget = QWidget()
         left_widget.setLayout(left_layout)
         self.splitter.addWidget(left_widget)
         self.splitter.addWidget(self.textEdit)
-        self.splitter.setSizes([30, 950])
+        self.splitter.addWidget(self.preview)
+        self.splitter.setSizes([30, 950, 0])
         layout.addWidget(self.splitter)
         # Rechtsklick für das QListWidget einrichten
         self.listWidget.setContextMenuPolicy(3)  # CustomContextMenu
@@ -158,12 +602,160 @@ class NotizVerwaltung(QMainWindow):
 
     def splitter_toogle(self):
         if self.splitter.sizes()[0] != 0:
-            self.splitter.setSizes([0, self.splitter.sizes()[1]])
+            self.splitter.setSizes([0] + self.splitter.sizes()[1:])
         else:
             self.listWidget.adjustSize()
-            self.splitter.setSizes([self.listWidget.width(), self.splitter.sizes()[1]])
+            self.splitter.setSizes([self.listWidget.width()] + self.splitter.sizes()[1:])
             self.listWidget.adjustSize()
-            self.splitter.setSizes([self.listWidget.width(), self.splitter.sizes()[1]])
+            self.splitter.setSizes([self.listWidget.width()] + self.splitter.sizes()[1:])
+
+    def init_preview(self):
+        """Richtet Markdown-Hervorhebung und den Vorschau-Thread ein."""
+        self.highlighter = MarkdownHighlighter(self.textEdit.document())
+
+        # Vorschau erst nach einer Tipppause neu aufbauen
+        self.preview_timer = QTimer(self)
+        self.preview_timer.setSingleShot(True)
+        self.preview_timer.setInterval(300)
+        self.preview_timer.timeout.connect(self.update_preview)
+
+        self.preview_thread = QThread(self)
+        self.preview_worker = MarkdownPreviewWorker()
+        self.preview_worker.moveToThread(self.preview_thread)
+        self.preview_worker.rendered.connect(self.on_preview_rendered)
+        self.preview_thread.start()
+        # Thread bei jedem Ende der Ereignisschleife beenden, nicht nur über quit_app
+        QApplication.instance().aboutToQuit.connect(self.stop_preview_thread)
+
+    def stop_preview_thread(self):
+        self.preview_thread.quit()
+        self.preview_thread.wait()
+
+    def init_status_bar(self):
+        """Erstellt die Statusleiste mit Cursorposition und Dokumentstatistik."""
+        self.cursor_label = QLabel()
+        self.stats_label = QLabel()
+        self.statusBar().addWidget(self.cursor_label)
+        self.statusBar().addPermanentWidget(self.stats_label)
+
+        # Mehrere Signale pro Eingabe (Text, Cursor, Auswahl) zu einer Aktualisierung bündeln
+        self.status_timer = QTimer(self)
+        self.status_timer.setSingleShot(True)
+        self.status_timer.setInterval(0)
+        self.status_timer.timeout.connect(self.update_status_bar)
+
+        self.statistics = DocumentStatistics(self.textEdit.document())
+        self.statistics.changed.connect(self.status_timer.start)
+        self.textEdit.cursorPositionChanged.connect(self.status_timer.start)
+        self.textEdit.selectionChanged.connect(self.status_timer.start)
+        self.update_status_bar()
+
+    def update_status_bar(self):
+        cursor = self.textEdit.textCursor()
+        stats = self.statistics
+        line, column = stats.position(cursor)
+        self.cursor_label.setText(f"Zeile {line}, Spalte {column}")
+        text = f"{stats.characters()} Zeichen, {stats.words()} Wörter, {stats.lines()} Zeilen"
+        if cursor.hasSelection():
+            chars, words, lines = stats.selection(cursor)
+            text = f"Auswahl: {chars} Zeichen, {words} Wörter, {lines} Zeilen | " + text
+        self.stats_label.setText(text)
+
+    def open_preview_link(self, url):
+        # Relative Links beziehen sich auf das Notizen-Verzeichnis
+        if url.isRelative():
+            url = QUrl.fromLocalFile(self.notes_dir).resolved(url)
+        QDesktopServices.openUrl(url)
+
+    def toggle_preview(self, checked):
+        self.preview.setVisible(checked)
+        sizes = self.splitter.sizes()
+        if checked:
+            if sizes[2] == 0:
+                # Platz des Textfelds zwischen Textfeld und Vorschau aufteilen
+                self.splitter.setSizes([sizes[0], sizes[1] // 2, sizes[1] - sizes[1] // 2])
+            self.update_preview()
+        else:
+            self.preview_timer.stop()
+
+    def update_preview(self):
+        """Schickt nur noch nicht gerenderte Abschnitte an den Vorschau-Thread."""
+        if not self.preview_action.isChecked():
+            return
+        self.preview_generation += 1
+        sections = split_markdown_sections(self.textEdit.toPlainText())
+        missing = [section for section in set(sections) if section not in self.preview_cache]
+        self.pending_preview_sections = sections
+        if missing:
+            self.preview_worker.render_requested.emit(self.preview_generation, missing)
+        else:
+            self.patch_preview(sections)
+
+    def on_preview_rendered(self, generation, rendered):
+        self.preview_cache.update(rendered)
+        if generation == self.preview_generation:
+            self.patch_preview(self.pending_preview_sections)
+
+    def patch_preview(self, sections):
+        """Ersetzt in der Vorschau nur die Abschnitte, die sich geändert haben.
+
+        preview_block_counts merkt sich, wie viele Blöcke jeder Abschnitt belegt;
+        unveränderte Abschnitte am Anfang und Ende bleiben unangetastet.
+        """
+        old = self.preview_sections
+        start = 0
+        while start < min(len(old), len(sections)) and old[start] == sections[start]:
+            start += 1
+        end_old, end_new = len(old), len(sections)
+        while end_old > start and end_new > start and old[end_old - 1] == sections[end_new - 1]:
+            end_old -= 1
+            end_new -= 1
+        if start == end_new and end_old == len(old) and start > 0:
+            # Beim Zusammenführen zweier Blöcke gilt das Format des hinteren; werden nur
+            # Abschnitte am Ende entfernt, den vorangehenden Abschnitt mit ersetzen
+            start -= 1
+
+        document = self.preview.document()
+        first = sum(self.preview_block_counts[:start])
+        removed = sum(self.preview_block_counts[start:end_old])
+        scroll = self.preview.verticalScrollBar().value()
+        cursor = QTextCursor(document)
+        cursor.beginEditBlock()
+        if removed:
+            first_block = document.findBlockByNumber(first)
+            last_block = document.findBlockByNumber(first + removed - 1)
+            block_end = last_block.position() + last_block.length() - 1
+            if end_new > start:
+                # Blöcke bis auf einen leeren Block entfernen, der neu gefüllt wird
+                cursor.setPosition(first_block.position())
+            else:
+                # Abschnitte samt folgendem Absatztrenner entfernen
+                cursor.setPosition(first_block.position())
+                block_end = last_block.next().position()
+            cursor.setPosition(block_end, QTextCursor.KeepAnchor)
+            cursor.removeSelectedText()
+        elif end_new > start:
+            if first < sum(self.preview_block_counts):
+                # Leeren Block vor dem folgenden Abschnitt einfügen
+                cursor.setPosition(document.findBlockByNumber(first).position())
+                cursor.insertBlock()
+                cursor.movePosition(QTextCursor.PreviousBlock)
+            elif first > 0:
+                cursor.movePosition(QTextCursor.End)
+                cursor.insertBlock()
+
+        block_counts = []
+        for index in range(start, end_new):
+            if index > start:
+                cursor.insertBlock()
+            block_counts.append(insert_html_section(cursor, self.preview_cache[sections[index]]))
+        cursor.endEditBlock()
+        self.preview.verticalScrollBar().setValue(scroll)
+
+        self.preview_block_counts[start:end_old] = block_counts
+        self.preview_sections = sections
+        # Cache auf die aktuell angezeigten Abschnitte begrenzen
+        self.preview_cache = {section: self.preview_cache[section] for section in sections}
 
     def init_tray_icon(self):
         """Erstellt ein Tray-Icon mit Menü."""
@@ -263,6 +855,7 @@ class NotizVerwaltung(QMainWindow):
             self.textEdit.setPlainText(text_stream.readAll())
             self.textEdit.blockSignals(False)  # Reaktiviert Signale
         file.close()
+        self.update_preview()
         self.text_changed = False  # Text ist noch nicht geändert worden
         if note_file != "":
             note_file_clean=note_file.replace(".txt","")
@@ -271,6 +864,8 @@ class NotizVerwaltung(QMainWindow):
     def on_text_changed(self):
         # Markiert den Text als geändert
         self.text_changed = True
+        if self.preview_action.isChecked():
+            self.preview_timer.start()
 
     def save_note(self):
         # Speichert die geänderte Notiz in die Datei
@@ -386,6 +981,7 @@ class NotizVerwaltung(QMainWindow):
             'geometry': self.saveGeometry().data().hex(),   # Speichert die Geometrie
             'state': self.saveState().data().hex(),         # Speichert den Zustand
             'splitter_sizes': self.splitter.sizes(),        # Speichert die Größen des Splitters
+            'preview': self.preview_action.isChecked(),     # Speichert, ob die Vorschau angezeigt wird
             'font': {
                 'family': current_font.family(),
                 'size': current_font.pointSize(),
@@ -405,6 +1001,7 @@ class NotizVerwaltung(QMainWindow):
                     self.restoreGeometry(bytes.fromhex(settings['geometry']))   # Stelle die Geometrie wieder her
                     self.restoreState(bytes.fromhex(settings['state']))         # Stelle den Zustand wieder her
                     self.splitter.setSizes(settings['splitter_sizes'])          # Stelle die Größen des Splitters wieder her
+                    self.preview_action.setChecked(settings.get('preview', False))  # Vorschau wieder einblenden
                     
                     # Schriftart wiederherstellen
                     font_data = settings.get('font', {})